@@ -17,6 +17,7 @@
 #include <vector>
 
 #include <thrust/transform.h>
+#include <thrust/transform_reduce.h>
 
 #include <raft/cudart_utils.h>
 
@@ -34,6 +35,15 @@
 namespace cugraph {
 namespace detail {
 namespace {
+template <typename vertex_t>
+struct reached_depth_t {
+  vertex_t invalid_distance;
+  __device__ vertex_t operator()(vertex_t distance) const
+  {
+    return distance == invalid_distance ? vertex_t{0} : distance;
+  }
+};
+
 template <typename vertex_t, typename edge_t, typename weight_t, typename result_t>
 void betweenness_centrality_impl(raft::handle_t const& handle,
                                  legacy::GraphCSRView<vertex_t, edge_t, weight_t> const& graph,
@@ -82,6 +92,7 @@ void edge_betweenness_centrality_impl(raft::handle_t const& handle,
   // NOTE: As of 07/2020 NetworkX does not apply rescaling based on number
   // of sources
   // bc.rescale_by_total_sources_used(total_number_of_sources);
+  bc.rescale();
 }
 template <typename vertex_t>
 vertex_t get_total_number_of_sources(raft::handle_t const& handle, vertex_t local_number_of_sources)
@@ -163,6 +174,9 @@ void BC<vertex_t, edge_t, weight_t, result_t>::configure(result_t* betweenness,
   // --- Get Device Information ---
   initialize_device_information();
 
+  // --- Traversal setup, shared by every source ---
+  initialize_traversal();
+
   // --- Confirm that configuration went through ---
   configured_ = true;
 }
@@ -171,7 +185,6 @@ template <typename vertex_t, typename edge_t, typename weight_t, typename result
 void BC<vertex_t, edge_t, weight_t, result_t>::initialize_work_vectors()
 {
   distances_vec_.resize(number_of_vertices_);
-  predecessors_vec_.resize(number_of_vertices_);
   sp_counters_vec_.resize(number_of_vertices_);
   deltas_vec_.resize(number_of_vertices_);
 }
@@ -179,10 +192,9 @@ void BC<vertex_t, edge_t, weight_t, result_t>::initialize_work_vectors()
 template <typename vertex_t, typename edge_t, typename weight_t, typename result_t>
 void BC<vertex_t, edge_t, weight_t, result_t>::initialize_pointers_to_vectors()
 {
-  distances_    = distances_vec_.data().get();
-  predecessors_ = predecessors_vec_.data().get();
-  sp_counters_  = sp_counters_vec_.data().get();
-  deltas_       = deltas_vec_.data().get();
+  distances_   = distances_vec_.data().get();
+  sp_counters_ = sp_counters_vec_.data().get();
+  deltas_      = deltas_vec_.data().get();
 }
 
 template <typename vertex_t, typename edge_t, typename weight_t, typename result_t>
@@ -192,6 +204,22 @@ void BC<vertex_t, edge_t, weight_t, result_t>::initialize_device_information()
   max_block_dim_1D_ = handle_.get_device_properties().maxThreadsDim[0];
 }
 
+// The accumulation only relies on distances and shortest path counters,
+// the predecessors are not requested so the BFS skips storing them
+template <typename vertex_t, typename edge_t, typename weight_t, typename result_t>
+void BC<vertex_t, edge_t, weight_t, result_t>::initialize_traversal()
+{
+  bfs_ = std::make_unique<BFS<vertex_t>>(number_of_vertices_,
+                                         number_of_edges_,
+                                         offsets_ptr_,
+                                         indices_ptr_,
+                                         graph_.prop.directed,
+                                         TRAVERSAL_DEFAULT_ALPHA,
+                                         TRAVERSAL_DEFAULT_BETA,
+                                         handle_.get_stream());
+  bfs_->configure(distances_, nullptr, sp_counters_, nullptr);
+}
+
 template <typename vertex_t, typename edge_t, typename weight_t, typename result_t>
 void BC<vertex_t, edge_t, weight_t, result_t>::compute()
 {
@@ -206,39 +234,29 @@ void BC<vertex_t, edge_t, weight_t, result_t>::compute()
       compute_single_source(source_vertex);
     }
   }
-  rescale();
 }
 
 template <typename vertex_t, typename edge_t, typename weight_t, typename result_t>
 void BC<vertex_t, edge_t, weight_t, result_t>::compute_single_source(vertex_t source_vertex)
 {
   // Step 1) Singe-source shortest-path problem
-  cugraph::bfs(handle_,
-               graph_,
-               distances_,
-               predecessors_,
-               sp_counters_,
-               source_vertex,
-               graph_.prop.directed,
-               true);
+  bfs_->traverse(source_vertex);
 
   // FIXME: Remove that with a BC specific class to gather
   //        information during traversal
 
-  // Numeric max value is replaced by -1 as we look for the maximal depth of
-  // the traversal, this value is avalaible within the bfs implementation and
-  // there could be a way to access it directly and avoid both replace and the
-  // max
-  thrust::replace(handle_.get_thrust_policy(),
-                  distances_,
-                  distances_ + number_of_vertices_,
-                  std::numeric_limits<vertex_t>::max(),
-                  static_cast<vertex_t>(-1));
-  auto current_max_depth =
-    thrust::max_element(handle_.get_thrust_policy(), distances_, distances_ + number_of_vertices_);
-  vertex_t max_depth = 0;
-  RAFT_CUDA_TRY(
-    cudaMemcpy(&max_depth, current_max_depth, sizeof(vertex_t), cudaMemcpyDeviceToHost));
+  // Unreached vertices keep the numeric max value as distance, they are
+  // skipped while looking for the maximal depth of the traversal.  The
+  // distances are left untouched: the accumulation kernels never match the
+  // numeric max value against a depth, so there is no need to spend a full
+  // read/write pass replacing it
+  vertex_t max_depth =
+    thrust::transform_reduce(handle_.get_thrust_policy(),
+                             distances_,
+                             distances_ + number_of_vertices_,
+                             reached_depth_t<vertex_t>{std::numeric_limits<vertex_t>::max()},
+                             vertex_t{0},
+                             thrust::maximum<vertex_t>());
   // Step 2) Dependency accumulation
   accumulate(source_vertex, max_depth);
 }
@@ -247,9 +265,12 @@ template <typename vertex_t, typename edge_t, typename weight_t, typename result
 void BC<vertex_t, edge_t, weight_t, result_t>::accumulate(vertex_t source_vertex,
                                                           vertex_t max_depth)
 {
+  // The accumulation kernels assign one thread per vertex (grid-stride loop
+  // over the vertices), sizing the grid on the number of edges would launch
+  // up to average degree times more blocks than needed at every depth
   dim3 grid_configuration, block_configuration;
   block_configuration.x = max_block_dim_1D_;
-  grid_configuration.x  = min(max_grid_dim_1D_, (number_of_edges_ / block_configuration.x + 1));
+  grid_configuration.x  = min(max_grid_dim_1D_, (number_of_vertices_ / block_configuration.x + 1));
 
   initialize_dependencies();
 
@@ -306,7 +327,7 @@ void BC<vertex_t, edge_t, weight_t, result_t>::accumulate_vertices_with_endpoint
   add_vertices_dependencies_to_betweenness();
 }
 
-// Distances should contain -1 for unreached nodes,
+// Distances contain the numeric max value for unreached nodes,
 
 // FIXME: There might be a cleaner way to add a value to a single
 //        score in the betweenness vector
@@ -314,8 +335,10 @@ template <typename vertex_t, typename edge_t, typename weight_t, typename result
 void BC<vertex_t, edge_t, weight_t, result_t>::add_reached_endpoints_to_source_betweenness(
   vertex_t source_vertex)
 {
-  vertex_t number_of_unvisited_vertices =
-    thrust::count(handle_.get_thrust_policy(), distances_, distances_ + number_of_vertices_, -1);
+  vertex_t number_of_unvisited_vertices = thrust::count(handle_.get_thrust_policy(),
+                                                       distances_,
+                                                       distances_ + number_of_vertices_,
+                                                       std::numeric_limits<vertex_t>::max());
   vertex_t number_of_visited_vertices_except_source =
     number_of_vertices_ - number_of_unvisited_vertices - 1;
   rmm::device_vector<vertex_t> buffer(1);
@@ -360,6 +383,12 @@ void BC<vertex_t, edge_t, weight_t, result_t>::accumulate_vertices(vertex_t max_
 
 template <typename vertex_t, typename edge_t, typename weight_t, typename result_t>
 void BC<vertex_t, edge_t, weight_t, result_t>::rescale()
+{
+  apply_rescale_factor_to_betweenness(get_rescale_factor());
+}
+
+template <typename vertex_t, typename edge_t, typename weight_t, typename result_t>
+result_t BC<vertex_t, edge_t, weight_t, result_t>::get_rescale_factor()
 {
   bool modified           = false;
   result_t rescale_factor = static_cast<result_t>(1);
@@ -377,7 +406,7 @@ void BC<vertex_t, edge_t, weight_t, result_t>::rescale()
       modified = true;
     }
   }
-  apply_rescale_factor_to_betweenness(rescale_factor);
+  return rescale_factor;
 }
 
 template <typename vertex_t, typename edge_t, typename weight_t, typename result_t>
@@ -414,6 +443,7 @@ template <typename vertex_t, typename edge_t, typename weight_t, typename result
 void BC<vertex_t, edge_t, weight_t, result_t>::apply_rescale_factor_to_betweenness(
   result_t rescale_factor)
 {
+  if (rescale_factor == static_cast<result_t>(1)) { return; }
   size_t result_size = number_of_vertices_;
   if (is_edge_betweenness_) result_size = number_of_edges_;
   thrust::transform(handle_.get_thrust_policy(),
@@ -428,7 +458,9 @@ template <typename vertex_t, typename edge_t, typename weight_t, typename result
 void BC<vertex_t, edge_t, weight_t, result_t>::rescale_by_total_sources_used(
   vertex_t total_number_of_sources_used)
 {
-  result_t rescale_factor = static_cast<result_t>(1);
+  // The normalization is folded into the rescaling by the number of sources
+  // so that the betweenness is only scaled once
+  result_t rescale_factor = get_rescale_factor();
   result_t casted_total_number_of_sources_used =
     static_cast<result_t>(total_number_of_sources_used);
   result_t casted_number_of_vertices = static_cast<result_t>(number_of_vertices_);
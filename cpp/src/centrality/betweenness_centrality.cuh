@@ -17,8 +17,12 @@
 // Author: Xavier Cadet xcadet@nvidia.com
 
 #pragma once
+#include <memory>
+
 #include <rmm/device_vector.hpp>
 
+#include <traversal/legacy/bfs.cuh>
+
 namespace cugraph {
 namespace detail {
 template <typename vertex_t, typename edge_t, typename weight_t, typename result_t>
@@ -73,6 +77,7 @@ class BC {
                       vertex_t const* sources,
                       vertex_t const number_of_sources);
   void compute();
+  void rescale();
   void rescale_by_total_sources_used(vertex_t total_number_of_sources_used);
 
  private:
@@ -103,18 +108,19 @@ class BC {
 
   // --- Data required to perform computation ----
   rmm::device_vector<vertex_t> distances_vec_;
-  rmm::device_vector<vertex_t> predecessors_vec_;
   rmm::device_vector<double> sp_counters_vec_;
   rmm::device_vector<double> deltas_vec_;
 
   vertex_t* distances_ =
     nullptr;  // array<vertex_t>(|V|) stores the distances gathered by the latest SSSP
-  vertex_t* predecessors_ =
-    nullptr;  // array<weight_t>(|V|) stores the predecessors of the latest SSSP
   double* sp_counters_ =
     nullptr;  // array<vertex_t>(|V|) stores the shortest path counter for the latest SSSP
   double* deltas_ = nullptr;  // array<result_t>(|V|) stores the dependencies for the latest SSSP
 
+  // The traversal only depends on the graph for its setup (vertex degrees,
+  // isolated vertices), it is built once and reused for every source
+  std::unique_ptr<BFS<vertex_t>> bfs_;
+
   int max_grid_dim_1D_  = 0;
   int max_block_dim_1D_ = 0;
 
@@ -123,6 +129,7 @@ class BC {
   void initialize_work_vectors();
   void initialize_pointers_to_vectors();
   void initialize_device_information();
+  void initialize_traversal();
 
   void compute_single_source(vertex_t source_vertex);
 
@@ -137,7 +144,7 @@ class BC {
   void add_reached_endpoints_to_source_betweenness(vertex_t source_vertex);
   void add_vertices_dependencies_to_betweenness();
 
-  void rescale();
+  result_t get_rescale_factor();
   std::tuple<result_t, bool> rescale_vertices_betweenness_centrality(result_t rescale_factor,
                                                                      bool modified);
   std::tuple<result_t, bool> rescale_edges_betweenness_centrality(result_t rescale_factor,
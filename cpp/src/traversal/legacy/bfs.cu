@@ -173,7 +173,8 @@ void BFS<IndexType>::traverse(IndexType source_vertex)
   if (sp_counters) {
     cudaMemsetAsync(sp_counters, 0, number_of_vertices * sizeof(double), stream);
     double value = 1;
-    cudaMemcpyAsync(sp_counters + source_vertex, &value, sizeof(double), cudaMemcpyHostToDevice);
+    cudaMemcpyAsync(
+      sp_counters + source_vertex, &value, sizeof(double), cudaMemcpyHostToDevice, stream);
   }
 
   //
@@ -193,7 +194,8 @@ void BFS<IndexType>::traverse(IndexType source_vertex)
     cudaMemcpyAsync(&current_visited_bmap_source_vert,
                     visited_bmap.data().get() + (source_vertex / INT_SIZE),
                     sizeof(int),
-                    cudaMemcpyDeviceToHost);
+                    cudaMemcpyDeviceToHost,
+                    stream);
     // We need current_visited_bmap_source_vert
     cudaStreamSynchronize(stream);
   }
@@ -58,6 +58,8 @@ from cugraph.structure import (
 
 from cugraph.centrality import (
     betweenness_centrality,
+    betweenness_centrality_async,
+    betweenness_centrality_many,
     edge_betweenness_centrality,
     katz_centrality,
 )
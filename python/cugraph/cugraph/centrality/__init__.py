@@ -14,5 +14,7 @@
 from cugraph.centrality.katz_centrality import katz_centrality
 from cugraph.centrality.betweenness_centrality import (
     betweenness_centrality,
+    betweenness_centrality_async,
+    betweenness_centrality_many,
     edge_betweenness_centrality,
 )
@@ -19,7 +19,7 @@
 from cugraph.structure.graph_primtypes cimport *
 from libcpp cimport bool
 
-cdef extern from "cugraph/algorithms.hpp" namespace "cugraph":
+cdef extern from "cugraph/algorithms.hpp" namespace "cugraph" nogil:
 
     cdef void betweenness_centrality[VT, ET, WT, result_t](
         const handle_t &handle,
@@ -11,17 +11,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import random
+import math
+import numbers
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import cupy as cp
 import cudf
 from cugraph.centrality import betweenness_centrality_wrapper
 from cugraph.centrality import edge_betweenness_centrality_wrapper
+import cugraph.comms.comms as Comms
+from cugraph.structure.graph_classes import Graph
+from cugraph.traversal import bfs_wrapper
 from cugraph.utilities import (df_edge_score_to_dictionary,
                                df_score_to_dictionary,
                                ensure_cugraph_obj_for_nx,
                                )
 
 
+_executor = None
+
+
 # NOTE: result_type=float could be an intuitive way to indicate the result type
 def betweenness_centrality(
     G,
@@ -31,6 +40,9 @@ def betweenness_centrality(
     endpoints=False,
     seed=None,
     result_dtype=np.float64,
+    epsilon=None,
+    delta=0.1,
+    out=None,
 ):
     """
     Compute the betweenness centrality for all vertices of the graph G.
@@ -53,14 +65,19 @@ def betweenness_centrality(
         BFS traversals. Use weight parameter if weights need to be considered
         (currently not supported)
 
-    k : int or list or None, optional (default=None)
+    k : int, list, cudf.Series, cupy.ndarray or None, optional (default=None)
         If k is not None, use k node samples to estimate betweenness.  Higher
         values give better approximation.  If k is a list, use the content
         of the list for estimation: the list should contain vertex
-        identifiers. If k is None (the default), all the vertices are used
+        identifiers. A cudf.Series or a cupy.ndarray of vertex identifiers
+        is handled as a list without being copied into a Python list, as
+        is any other sequence such as a tuple or a numpy.ndarray.
+        If k is None (the default), all the vertices are used
         to estimate betweenness.  Vertices obtained through sampling or
         defined as a list will be used assources for traversals inside the
         algorithm.
+        If k is 0 or an empty list, no traversal is performed and every
+        score is 0.
 
     normalized : bool, optional (default=True)
         If true, the betweenness values are normalized by
@@ -84,12 +101,44 @@ def betweenness_centrality(
     seed : optional
         if k is specified and k is an integer, use seed to initialize the
         random number generator.
-        Using None as seed relies on random.seed() behavior: using current
-        system time
+        Using None as seed draws a different sample at every call
         If k is either None or list: seed parameter is ignored
 
-    result_dtype : np.float32 or np.float64, optional, default=np.float64
-        Indicate the data type of the betweenness centrality scores
+    result_dtype : np.float32, np.float64 or 'auto', optional
+        (default=np.float64)
+        Indicate the data type of the betweenness centrality scores.
+        If 'auto', np.float32 is used when n * (n - 1) * (n - 2) / 2 is
+        below 2^24, so that scores remain distinguishable in single
+        precision, and np.float64 otherwise. np.float32 halves the memory
+        used by the scores, the dependencies are still accumulated in
+        double precision internally.
+
+    epsilon : float or None, optional (default=None)
+        If not None, k is ignored and the number of sampled sources is
+        derived from epsilon and delta with the sample size of Riondato
+        and Kornaropoulos:
+        __k = (0.5 / epsilon^2) * (floor(log2(VD - 2)) + 1 + ln(1 / delta))__
+        where VD is the vertex diameter of G, estimated from below with
+        double BFS sweeps from a few random vertices. This is a heuristic
+        sample size, smaller values of epsilon and delta give larger
+        samples: the error guarantee of Riondato and Kornaropoulos is for
+        sampling one shortest path per sampled pair of vertices and does
+        not carry over to the sampling of sources done here. VD is also
+        underestimated when the sweeps only reach a small part of G (e.g.
+        directed graphs with sinks). The sources are sampled using seed,
+        if k is not smaller than the number of vertices, all the vertices
+        are used.
+
+    delta : float, optional (default=0.1)
+        Second parameter of the sample size, in (0, 1), only used when
+        epsilon is not None.
+
+    out : cudf.DataFrame or None, optional (default=None)
+        If not None, a DataFrame returned by a previous call on a graph with
+        the same number of vertices and the same result_dtype. The scores
+        are written into it, overwriting its content, instead of into a
+        newly allocated DataFrame, and it is returned. This is only
+        supported for cugraph Graphs that are not renumbered.
 
     Returns
     -------
@@ -113,12 +162,122 @@ def betweenness_centrality(
     >>> bc = cugraph.betweenness_centrality(G)
 
     """
-    # vertices is intended to be a cuDF series that contains a sampling of
-    # k vertices out of the graph.
-    #
-    # NOTE: cuDF doesn't currently support sampling, but there is a python
-    # workaround.
+    G, isNx, vertices, result_dtype = _prepare_betweenness_centrality(
+        G, k, weight, seed, result_dtype, epsilon, delta
+    )
+
+    return _compute_betweenness_centrality(
+        G, isNx, normalized, weight, endpoints, vertices, result_dtype, out
+    )
+
+
+def betweenness_centrality_async(
+    G,
+    k=None,
+    normalized=True,
+    weight=None,
+    endpoints=False,
+    seed=None,
+    result_dtype=np.float64,
+    epsilon=None,
+    delta=0.1,
+):
+    """
+    Asynchronous version of betweenness_centrality.
+
+    The sources are sampled (or looked up) in the calling thread, then the
+    traversals are queued on a worker thread that releases the GIL while
+    the GPU computes.  Sampling the sources of the next call can therefore
+    overlap with the computation of the previous one, which is useful when
+    processing many batches of sources (e.g. adaptive sampling).  Calls are
+    executed in submission order.
+
+    Parameters
+    ----------
+    See betweenness_centrality, the parameters are the same.
+
+    Returns
+    -------
+    future : concurrent.futures.Future
+        Future whose result() is the value betweenness_centrality would
+        have returned.
+
+    Examples
+    --------
+    >>> gdf = cudf.read_csv(datasets_path / 'karate.csv', delimiter=' ',
+    ...                     dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(gdf, source='0', destination='1')
+    >>> futures = [cugraph.betweenness_centrality_async(G, k=4, seed=s)
+    ...            for s in range(4)]
+    >>> bcs = [f.result() for f in futures]
+
+    """
+    G, isNx, vertices, result_dtype = _prepare_betweenness_centrality(
+        G, k, weight, seed, result_dtype, epsilon, delta
+    )
+
+    return _get_executor().submit(
+        _compute_betweenness_centrality_async,
+        G, isNx, normalized, weight, endpoints, vertices, result_dtype
+    )
+
+
+def betweenness_centrality_many(
+    Gs,
+    normalized=True,
+    weight=None,
+    endpoints=False,
+    result_dtype=np.float64,
+):
+    """
+    Compute the betweenness centrality for all vertices of several graphs
+    with a single call.
+
+    The graphs are assembled into one block-diagonal graph (their adjacency
+    lists are concatenated with shifted offsets and indices), the
+    traversals from every vertex run in one call, and the scores are split
+    back per graph.  This amortizes the per-call overhead when processing
+    many small graphs (e.g. the connected components of a larger graph).
+
+    Every vertex of each graph is used as a source.
+
+    Parameters
+    ----------
+    Gs : list of cuGraph.Graph or networkx.Graph
+        The graphs must either all be directed or all be undirected.
+
+    normalized : bool, optional (default=True)
+        If true, the betweenness values of each graph are normalized by
+        __2 / ((n - 1) * (n - 2))__ for undirected Graphs, and
+        __1 / ((n - 1) * (n - 2))__ for directed Graphs
+        where n is the number of nodes in that graph.
+
+    weight : cudf.DataFrame, optional (default=None)
+        Specifies the weights to be used for each edge.
+        (Not Supported)
+
+    endpoints : bool, optional (default=False)
+        If true, include the endpoints in the shortest path counts.
+
+    result_dtype : np.float32 or np.float64, optional, default=np.float64
+        Indicate the data type of the betweenness centrality scores
+
+    Returns
+    -------
+    dfs : list of cudf.DataFrame or Dictionary if using NetworkX
+        One element per graph of Gs, in the same order, each one as
+        described in betweenness_centrality.
+
+    Examples
+    --------
+    >>> gdf = cudf.read_csv(datasets_path / 'karate.csv', delimiter=' ',
+    ...                     dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(gdf, source='0', destination='1')
+    >>> bcs = cugraph.betweenness_centrality_many([G, G])
 
+    """
     if weight is not None:
         raise NotImplementedError(
             "weighted implementation of betweenness "
@@ -128,22 +287,62 @@ def betweenness_centrality(
     if result_dtype not in [np.float32, np.float64]:
         raise TypeError("result type can only be np.float32 or np.float64")
 
-    G, isNx = ensure_cugraph_obj_for_nx(G)
-
-    vertices = _initialize_vertices(G, k, seed)
+    if len(Gs) == 0:
+        return []
+
+    graphs = [ensure_cugraph_obj_for_nx(G) for G in Gs]
+    directed = graphs[0][0].is_directed()
+    if any(G.is_directed() != directed for G, _ in graphs):
+        raise ValueError("graphs must either all be directed or all be "
+                         "undirected")
+
+    offsets = []
+    indices = []
+    vertex_offsets = [0]
+    number_of_edges = 0
+    for G, _ in graphs:
+        if not G.adjlist:
+            G.view_adj_list()
+        offsets.append(
+            (G.adjlist.offsets[:-1] + number_of_edges).astype(np.int32))
+        indices.append(
+            (G.adjlist.indices + vertex_offsets[-1]).astype(np.int32))
+        vertex_offsets.append(vertex_offsets[-1] + G.number_of_vertices())
+        number_of_edges += len(G.adjlist.indices)
+    offsets.append(cudf.Series([number_of_edges], dtype=np.int32))
+
+    block_diagonal_graph = Graph(directed=directed)
+    block_diagonal_graph.from_cudf_adjlist(
+        cudf.concat(offsets, ignore_index=True),
+        cudf.concat(indices, ignore_index=True)
+    )
 
+    # The normalization depends on the number of vertices of each graph,
+    # it is applied per graph once the scores are split
     df = betweenness_centrality_wrapper.betweenness_centrality(
-        G, normalized, endpoints, weight, vertices, result_dtype
+        block_diagonal_graph, False, endpoints, weight, None, result_dtype
     )
 
-    if G.renumbered:
-        df = G.unrenumber(df, "vertex")
+    results = []
+    for idx, (G, isNx) in enumerate(graphs):
+        begin, end = vertex_offsets[idx], vertex_offsets[idx + 1]
+        graph_df = df.iloc[begin:end].reset_index(drop=True)
+        graph_df["vertex"] = graph_df["vertex"] - begin
+        if normalized:
+            factor = _normalization_factor(end - begin, directed, endpoints)
+            graph_df["betweenness_centrality"] = \
+                graph_df["betweenness_centrality"] * result_dtype(factor)
 
-    if isNx is True:
-        dict = df_score_to_dictionary(df, 'betweenness_centrality')
-        return dict
-    else:
-        return df
+        if G.renumbered:
+            graph_df = G.unrenumber(graph_df, "vertex")
+
+        if isNx is True:
+            results.append(
+                df_score_to_dictionary(graph_df, 'betweenness_centrality'))
+        else:
+            results.append(graph_df)
+
+    return results
 
 
 def edge_betweenness_centrality(
@@ -175,13 +374,18 @@ def edge_betweenness_centrality(
         BFS traversals. Use weight parameter if weights need to be considered
         (currently not supported)
 
-    k : int or list or None, optional (default=None)
+    k : int, list, cudf.Series, cupy.ndarray or None, optional (default=None)
         If k is not None, use k node samples to estimate betweenness.  Higher
         values give better approximation.
         If k is a list, use the content of the list for estimation: the list
-        should contain vertices identifiers.
+        should contain vertices identifiers. A cudf.Series or a cupy.ndarray
+        of vertex identifiers is handled as a list without being copied into
+        a Python list, as is any other sequence such as a tuple or a
+        numpy.ndarray.
         Vertices obtained through sampling or defined as a list will be used as
         sources for traversals inside the algorithm.
+        If k is 0 or an empty list, no traversal is performed and every
+        score is 0.
 
     normalized : bool, optional (default=True)
         If true, the betweenness values are normalized by
@@ -201,8 +405,7 @@ def edge_betweenness_centrality(
     seed : optional (default=None)
         if k is specified and k is an integer, use seed to initialize the
         random number generator.
-        Using None as seed relies on random.seed() behavior: using current
-        system time
+        Using None as seed draws a different sample at every call
         If k is either None or list: seed parameter is ignored
 
     result_dtype : np.float32 or np.float64, optional (default=np.float64)
@@ -250,12 +453,17 @@ def edge_betweenness_centrality(
     if result_dtype not in [np.float32, np.float64]:
         raise TypeError("result type can only be np.float32 or np.float64")
 
+    _check_k(k)
+
     G, isNx = ensure_cugraph_obj_for_nx(G)
     vertices = _initialize_vertices(G, k, seed)
 
-    df = edge_betweenness_centrality_wrapper.edge_betweenness_centrality(
-        G, normalized, weight, vertices, result_dtype
-    )
+    if vertices is not None and len(vertices) == 0:
+        df = _zero_edge_betweenness_centrality(G, result_dtype)
+    else:
+        df = edge_betweenness_centrality_wrapper.edge_betweenness_centrality(
+            G, normalized, weight, vertices, result_dtype
+        )
 
     if G.renumbered:
         df = G.unrenumber(df, "src")
@@ -280,23 +488,247 @@ def edge_betweenness_centrality(
         return df
 
 
-# In order to compare with pre-set sources,
-# k can either be a list or an integer or None
-#  int: Generate an random sample with k elements
-# list: k become the length of the list and vertices become the content
-# None: All the vertices are considered
+def _prepare_betweenness_centrality(
+    G, k, weight, seed, result_dtype, epsilon, delta
+):
+    # vertices is intended to be a cuDF series that contains a sampling of
+    # k vertices out of the graph.
+    #
+    # NOTE: cuDF doesn't currently support sampling, but there is a python
+    # workaround.
+
+    if weight is not None:
+        raise NotImplementedError(
+            "weighted implementation of betweenness "
+            "centrality not currently supported"
+        )
+
+    if result_dtype != "auto" and result_dtype not in [np.float32,
+                                                       np.float64]:
+        raise TypeError("result type can only be np.float32, np.float64 "
+                        "or 'auto'")
+
+    _check_k(k)
+
+    if epsilon is not None:
+        if not 0 < epsilon < 1:
+            raise ValueError("epsilon must be in (0, 1)")
+        if not 0 < delta < 1:
+            raise ValueError("delta must be in (0, 1)")
+
+    G, isNx = ensure_cugraph_obj_for_nx(G)
+
+    # The adjacency list is built lazily by the wrapper, it is built here so
+    # that asynchronous calls do not modify G from the worker thread
+    if not G.adjlist:
+        G.view_adj_list()
+
+    if result_dtype == "auto":
+        result_dtype = _select_result_dtype(G.number_of_vertices())
+
+    if epsilon is not None:
+        k = _number_of_samples_from_epsilon(G, epsilon, delta, seed)
+
+    vertices = _initialize_vertices(G, k, seed)
+
+    return G, isNx, vertices, result_dtype
+
+
+def _compute_betweenness_centrality(
+    G, isNx, normalized, weight, endpoints, vertices, result_dtype, out=None
+):
+    number_of_vertices = G.number_of_vertices()
+    if out is not None:
+        _check_out(G, isNx, out, result_dtype)
+
+    # Without sources, or without any path through an intermediate vertex,
+    # every score is zero and the wrapper is not called
+    if (vertices is not None and len(vertices) == 0) or \
+            (number_of_vertices < 3 and not endpoints):
+        if out is None:
+            df = cudf.DataFrame()
+            df["vertex"] = cudf.Series(
+                cp.arange(number_of_vertices, dtype=np.int32))
+            df["betweenness_centrality"] = cudf.Series(
+                cp.zeros(number_of_vertices, dtype=result_dtype))
+        else:
+            df = out
+            cp.asarray(df["vertex"])[:] = cp.arange(number_of_vertices)
+            cp.asarray(df["betweenness_centrality"]).fill(0)
+    else:
+        df = betweenness_centrality_wrapper.betweenness_centrality(
+            G, normalized, endpoints, weight, vertices, result_dtype, out
+        )
+
+    if G.renumbered:
+        df = G.unrenumber(df, "vertex")
+
+    if isNx is True:
+        dict = df_score_to_dictionary(df, 'betweenness_centrality')
+        return dict
+    else:
+        return df
+
+
+# The scores are written in place into out, it has to be laid out as the
+# wrapper output and the vertex identifiers must not need unrenumbering
+def _check_out(G, isNx, out, result_dtype):
+    if isNx or G.renumbered:
+        raise ValueError("out is only supported for cugraph Graphs that are "
+                         "not renumbered")
+    if not isinstance(out, cudf.DataFrame) or \
+            not {"vertex", "betweenness_centrality"} <= set(out.columns) or \
+            len(out) != G.number_of_vertices() or \
+            out["vertex"].dtype != np.int32 or \
+            out["betweenness_centrality"].dtype != result_dtype:
+        raise ValueError("out must be a DataFrame returned by "
+                         "betweenness_centrality for a graph with the "
+                         "same number of vertices and result_dtype")
+
+
+# Scores of the edges of the adjacency list, laid out as the wrapper returns
+# them, when no source is given
+def _zero_edge_betweenness_centrality(G, result_dtype):
+    if not G.adjlist:
+        G.view_adj_list()
+    offsets = cp.asarray(G.adjlist.offsets)
+    number_of_edges = len(G.adjlist.indices)
+    src = cp.searchsorted(offsets, cp.arange(number_of_edges),
+                          side="right") - 1
+    df = cudf.DataFrame()
+    df["src"] = cudf.Series(src.astype(np.int32))
+    df["dst"] = G.adjlist.indices.copy()
+    df["betweenness_centrality"] = cudf.Series(
+        cp.zeros(number_of_edges, dtype=result_dtype))
+    return df
+
+
+# Converts unnormalized scores, as returned by the C++ implementation (i.e.
+# halved for undirected graphs), into normalized scores
+def _normalization_factor(number_of_vertices, directed, endpoints):
+    n = number_of_vertices
+    if n <= 2:
+        factor = 1.0
+    elif endpoints:
+        factor = 1.0 / (n * (n - 1))
+    else:
+        factor = 1.0 / ((n - 1) * (n - 2))
+    if not directed:
+        factor *= 2
+    return factor
+
+
+# Runs on the worker thread, the wrapper computes the result on the stream
+# of the default handle, the per-thread default stream of the worker which
+# the caller's streams are not ordered with. That stream alone is
+# synchronized before the future resolves so that work the caller queued
+# meanwhile is not waited for.
+def _compute_betweenness_centrality_async(
+    G, isNx, normalized, weight, endpoints, vertices, result_dtype
+):
+    result = _compute_betweenness_centrality(
+        G, isNx, normalized, weight, endpoints, vertices, result_dtype
+    )
+    Comms.get_default_handle().sync()
+    return result
+
+
+# A single worker runs the queued calls one after the other, the graph is
+# only read by the worker since _prepare_betweenness_centrality builds the
+# adjacency list on the calling thread
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1)
+    return _executor
+
+
+# float32 is selected as long as n * (n - 1) * (n - 2) / 2 fits in the 24
+# bits of its significand, so that ties in the scores are still
+# distinguishable in single precision
+def _select_result_dtype(number_of_vertices):
+    n = number_of_vertices
+    if n * (n - 1) * (n - 2) // 2 < 2 ** 24:
+        return np.float32
+    return np.float64
+
+
+# Sample size of Riondato and Kornaropoulos (2016), 'Fast approximation of
+# betweenness centrality through sampling', with c = 0.5.
+# NOTE: Their guarantee is for sampling shortest paths, it is only used here
+#       as a heuristic number of sampled sources.
+# Returns None (i.e. every vertex is a source) if the bound is not smaller
+# than the number of vertices.
+def _number_of_samples_from_epsilon(G, epsilon, delta, seed):
+    number_of_vertices = G.number_of_vertices()
+    vertex_diameter = _estimate_vertex_diameter(G, seed)
+    log_term = 0
+    if vertex_diameter > 2:
+        log_term = math.floor(math.log2(vertex_diameter - 2))
+    k = math.ceil((0.5 / epsilon ** 2) *
+                  (log_term + 1 + math.log(1 / delta)))
+    if k >= number_of_vertices:
+        return None
+    return k
+
+
+# The vertex diameter (number of vertices on the longest shortest path) is
+# estimated through double sweeps: a BFS from a random vertex followed by a
+# BFS from the farthest vertex it reached. The sweeps start from several
+# vertices and the largest distance is kept, on directed graphs a start
+# vertex may be close to a sink and reach few vertices.
+# NOTE: This is a lower bound, exact on undirected trees, it only covers the
+#       vertices reachable from the start vertices.
+def _estimate_vertex_diameter(G, seed, number_of_starts=4):
+    # The BFS reads the edge list, a graph built from an adjacency list
+    # does not have one yet
+    if G.edgelist is None:
+        G.view_edge_list()
+    number_of_vertices = G.number_of_vertices()
+    rng = np.random.default_rng(seed)
+    starts = rng.choice(number_of_vertices,
+                        size=min(number_of_starts, number_of_vertices),
+                        replace=False)
+    max_distance = 0
+    for start in starts:
+        start = int(start)
+        for _ in range(2):
+            df = bfs_wrapper.bfs(G, cudf.Series([start], dtype=np.int32),
+                                 None)
+            df = df[df["distance"] < np.iinfo(np.int32).max]
+            farthest = df.nlargest(1, "distance")
+            max_distance = max(max_distance,
+                               int(farthest["distance"].iloc[0]))
+            start = int(farthest["vertex"].iloc[0])
+    return max_distance + 1
+
+
+# k is normalized once instead of being dispatched on its exact type:
+# None: All the vertices are considered, the wrappers receive None and
+#       let the C++ implementation iterate over every vertex
+# Anything with a length (list, tuple, numpy.ndarray, cudf.Series,
+#       cupy.ndarray): the content is used as the vertex identifiers of the
+#       sources, device containers stay on device until they are renumbered
+# Integer: Generate an random sample with k elements
 def _initialize_vertices(G, k, seed):
-    vertices = None
-    numpy_vertices = None
-    if k is not None:
-        if isinstance(k, int):
-            vertices = _initialize_vertices_from_indices_sampling(G, k, seed)
-        elif isinstance(k, list):
-            vertices = _initialize_vertices_from_identifiers_list(G, k)
-        numpy_vertices = np.array(vertices, dtype=np.int32)
+    if k is None:
+        return None
+    if hasattr(k, "__len__"):
+        vertices = _initialize_vertices_from_identifiers_list(G, k)
     else:
-        numpy_vertices = np.arange(G.number_of_vertices(), dtype=np.int32)
-    return numpy_vertices
+        vertices = _initialize_vertices_from_indices_sampling(G, int(k),
+                                                              seed)
+    # The wrapper reads the batch as contiguous int32 values, possibly after
+    # returning to the caller in the asynchronous case: always hand it a copy
+    # rather than a view of the caller's buffer
+    return np.array(vertices, dtype=np.int32, order="C", copy=True)
+
+
+def _check_k(k):
+    if k is not None and not hasattr(k, "__len__") and \
+            not isinstance(k, numbers.Integral):
+        raise TypeError("k can only be an integer, a sequence of vertex "
+                        "identifiers or None")
 
 
 # NOTE: We do not renumber in case k is an int, the sampling is
@@ -307,17 +739,93 @@ def _initialize_vertices(G, k, seed):
 # - vertices '0' '1' '3' '4' exist
 # - There is a vertex at index 2 (there is not guarantee that it is
 #   vertice '3' )
+#
+# NOTE: Sampling a large fraction of the vertices without replacement
+#       amounts to permuting all of them, this is done on device and only
+#       the k sampled vertices are copied back to host.  Smaller samples
+#       are drawn on host.
 def _initialize_vertices_from_indices_sampling(G, k, seed):
-    random.seed(seed)
-    vertices = random.sample(range(G.number_of_vertices()), k)
-    return vertices
-
-
+    number_of_vertices = G.number_of_vertices()
+    # Checked up front, the device permutation would silently truncate k
+    if not 0 <= k <= number_of_vertices:
+        raise ValueError("k must be between 0 and the number of vertices")
+    if k > number_of_vertices // 8:
+        rs = cp.random.RandomState(seed)
+        vertices = rs.permutation(number_of_vertices)[:k].astype(np.int32)
+        return cp.asnumpy(vertices)
+    rng = np.random.default_rng(seed)
+    vertices = rng.choice(number_of_vertices, size=k, replace=False)
+    return vertices.astype(np.int32)
+
+
+def _cast_identifiers(identifiers, dtype):
+    identifiers = cudf.Series(identifiers)
+    # Identifiers changed by the cast (out of range or fractional) are not in
+    # the graph, even if the cast value is
+    casted_identifiers = identifiers.astype(dtype)
+    if identifiers.isnull().any() or \
+            (casted_identifiers.astype(identifiers.dtype) !=
+             identifiers).any():
+        raise ValueError("k contains vertices that are not in the graph")
+    return casted_identifiers
+
+
+# NOTE: The lookup of the internal identifiers is done through a binary
+#       search of the renumber map sorted by external identifier
+#       (O(k log N)) rather than one scan of the map per identifier.
 def _initialize_vertices_from_identifiers_list(G, identifiers):
     vertices = identifiers
     if G.renumbered:
-        vertices = G.lookup_internal_vertex_id(
-            cudf.Series(vertices)
-        ).to_numpy()
+        sorted_map = _get_sorted_renumber_map(G)
+        if sorted_map is not None:
+            external_ids = sorted_map["0"]
+            vertices = _cast_identifiers(vertices, external_ids.dtype)
+            positions = external_ids.searchsorted(vertices)
+            positions = cp.minimum(cp.asarray(positions),
+                                   len(external_ids) - 1)
+            # A single membership test rather than a partial lookup failing
+            # on the first missing identifier
+            found = external_ids.iloc[positions].values == vertices.values
+            if not found.all():
+                raise ValueError("k contains vertices that are not in the "
+                                 "graph")
+            vertices = sorted_map["id"].iloc[positions]
+        else:
+            vertices = G.lookup_internal_vertex_id(cudf.Series(vertices))
+            if vertices.isnull().any():
+                raise ValueError("k contains vertices that are not in the "
+                                 "graph")
+        vertices = vertices.astype(np.int32).to_numpy()
+    else:
+        vertices = _cast_identifiers(vertices, np.int32)
+        if ((vertices < 0) | (vertices >= G.number_of_vertices())).any():
+            raise ValueError("k contains vertices that are not in the graph")
+        vertices = vertices.to_numpy()
 
     return vertices
+
+
+# The renumber map sorted by external vertex id is cached on the graph so
+# that repeated calls with different lists of sources (e.g. adaptive
+# sampling) do not sort it again, a map that is already sorted is not
+# copied.  The cache is keyed on the identity of the renumber map and is
+# only built for single GPU maps over a single numeric vertex column, other
+# maps fall back to G.lookup_internal_vertex_id.
+def _get_sorted_renumber_map(G):
+    renumber_map = G.renumber_map
+    cached = getattr(G, "_sorted_renumber_map", None)
+    if cached is not None and cached[0] is renumber_map:
+        return cached[1]
+
+    map_df = getattr(renumber_map.implementation, "df", None)
+    if not isinstance(map_df, cudf.DataFrame) or \
+            renumber_map.implementation.col_names != ["0"] or \
+            len(map_df) == 0 or \
+            not np.issubdtype(map_df["0"].dtype, np.number):
+        return None
+
+    sorted_map = map_df[["0", "id"]]
+    if not sorted_map["0"].is_monotonic_increasing:
+        sorted_map = sorted_map.sort_values("0").reset_index(drop=True)
+    G._sorted_renumber_map = (renumber_map, sorted_map)
+    return sorted_map
@@ -21,13 +21,19 @@ from cugraph.structure.graph_primtypes cimport *
 from libc.stdint cimport uintptr_t
 from libcpp cimport bool
 import cudf
+import cupy as cp
 import numpy as np
 import cugraph.comms.comms as Comms
 from cugraph.dask.common.mg_utils import get_client
 import dask.distributed
 
 
-def get_output_df(number_of_vertices, result_dtype):
+def get_output_df(number_of_vertices, result_dtype, out=None):
+    if out is not None:
+        # The C++ implementation accumulates the dependencies into the
+        # scores, the reused buffer has to start from zero
+        cp.asarray(out['betweenness_centrality']).fill(0)
+        return out
     df = cudf.DataFrame()
     df['vertex'] = cudf.Series(np.zeros(number_of_vertices, dtype=np.int32))
     df['betweenness_centrality'] = cudf.Series(np.zeros(number_of_vertices,
@@ -55,23 +61,25 @@ cdef void run_c_betweenness_centrality(uintptr_t c_handle,
                                        uintptr_t c_batch,
                                        result_dtype):
     if result_dtype == np.float64:
-        c_betweenness_centrality[int, int, double, double]((<handle_t *> c_handle)[0],
-                                                           (<GraphCSRView[int, int, double] *> c_graph)[0],
-                                                           <double *> c_betweenness,
-                                                           normalized,
-                                                           endpoints,
-                                                           <double *> c_weights,
-                                                           number_of_sources_in_batch,
-                                                           <int *> c_batch)
+        with nogil:
+            c_betweenness_centrality[int, int, double, double]((<handle_t *> c_handle)[0],
+                                                               (<GraphCSRView[int, int, double] *> c_graph)[0],
+                                                               <double *> c_betweenness,
+                                                               normalized,
+                                                               endpoints,
+                                                               <double *> c_weights,
+                                                               number_of_sources_in_batch,
+                                                               <int *> c_batch)
     elif result_dtype == np.float32:
-        c_betweenness_centrality[int, int, float, float]((<handle_t *> c_handle)[0],
-                                                         (<GraphCSRView[int, int, float] *> c_graph)[0],
-                                                         <float *> c_betweenness,
-                                                         normalized,
-                                                         endpoints,
-                                                         <float *> c_weights,
-                                                         number_of_sources_in_batch,
-                                                         <int *> c_batch)
+        with nogil:
+            c_betweenness_centrality[int, int, float, float]((<handle_t *> c_handle)[0],
+                                                             (<GraphCSRView[int, int, float] *> c_graph)[0],
+                                                             <float *> c_betweenness,
+                                                             normalized,
+                                                             endpoints,
+                                                             <float *> c_weights,
+                                                             number_of_sources_in_batch,
+                                                             <int *> c_batch)
     else:
         raise ValueError("result_dtype can only be np.float64 or np.float32")
 
@@ -79,7 +87,8 @@ cdef void run_c_betweenness_centrality(uintptr_t c_handle,
 def run_internal_work(handle, input_data, normalized, endpoints,
                       weights,
                       batch,
-                      result_dtype):
+                      result_dtype,
+                      out=None):
     cdef uintptr_t c_handle = <uintptr_t> NULL
     cdef uintptr_t c_graph = <uintptr_t> NULL
     cdef uintptr_t c_identifier = <uintptr_t> NULL
@@ -105,8 +114,7 @@ def run_internal_work(handle, input_data, normalized, endpoints,
     number_of_edges = len(indices)
 
     result_size = number_of_vertices
-    result_df = get_output_df(result_size, result_dtype)
-    number_of_sources_in_batch = len(batch)
+    result_df = get_output_df(result_size, result_dtype, out)
     if result_dtype == np.float64:
         graph_double = GraphCSRView[int, int, double](<int*> c_offsets,
                                                       <int*> c_indices,
@@ -131,7 +139,12 @@ def run_internal_work(handle, input_data, normalized, endpoints,
     if weights is not None:
         c_weights = weights.__cuda_array_interface__['data'][0]
 
-    c_batch = batch.__array_interface__['data'][0]
+    # A batch of None lets the C++ implementation use every vertex as a
+    # source without materializing the list of sources
+    number_of_sources_in_batch = 0
+    if batch is not None:
+        number_of_sources_in_batch = len(batch)
+        c_batch = batch.__array_interface__['data'][0]
     c_handle = <uintptr_t>handle.getHandle()
 
     run_c_betweenness_centrality(c_handle,
@@ -173,6 +186,9 @@ def batch_betweenness_centrality(input_graph, normalized, endpoints,
                                     weights, vertices, result_dtype):
     df = None
     client = get_client()
+    # The sources are split among the workers, they need to be explicit
+    if vertices is None:
+        vertices = np.arange(input_graph.number_of_vertices(), dtype=np.int32)
     comms = Comms.get_comms()
     replicated_adjlists = input_graph.batch_adjlists
     work_futures =  [client.submit(run_mg_work,
@@ -191,13 +207,13 @@ def batch_betweenness_centrality(input_graph, normalized, endpoints,
 
 
 def sg_betweenness_centrality(input_graph, normalized, endpoints, weights,
-                              vertices, result_dtype):
+                              vertices, result_dtype, out=None):
     handle = Comms.get_default_handle()
     adjlist = input_graph.adjlist
     input_data = ((adjlist.offsets, adjlist.indices, adjlist.weights),
                   input_graph.is_directed())
     df = run_internal_work(handle, input_data, normalized, endpoints, weights,
-                           vertices, result_dtype)
+                           vertices, result_dtype, out)
     return df
 
 
@@ -206,7 +222,7 @@ def sg_betweenness_centrality(input_graph, normalized, endpoints, weights,
 #       The current BFS requires the GraphCSR to be declared
 #       as <int, int, float> or <int, int double> even if weights is null
 def betweenness_centrality(input_graph, normalized, endpoints, weights,
-                           vertices, result_dtype):
+                           vertices, result_dtype, out=None):
     """
     Call betweenness centrality
     """
@@ -222,11 +238,17 @@ def betweenness_centrality(input_graph, normalized, endpoints, weights,
                                              weights,
                                              vertices,
                                              result_dtype)
+        # The workers allocate their own output, it is copied into out
+        if out is not None:
+            for name in df.columns:
+                cp.asarray(out[name])[:] = cp.asarray(df[name])
+            df = out
     else:
         df = sg_betweenness_centrality(input_graph,
                                        normalized,
                                        endpoints,
                                        weights,
                                        vertices,
-                                       result_dtype)
+                                       result_dtype,
+                                       out)
     return df
@@ -95,7 +95,6 @@ def run_internal_work(handle, input_data, normalized, weights, batch,
     c_dst_identifier = result_df['dst'].__cuda_array_interface__['data'][0]
     c_betweenness = result_df['betweenness_centrality'].__cuda_array_interface__['data'][0]
 
-    number_of_sources_in_batch = len(batch)
     if result_dtype == np.float64:
         graph_double = GraphCSRView[int, int, double](<int*> c_offsets,
                                                       <int*> c_indices,
@@ -117,7 +116,12 @@ def run_internal_work(handle, input_data, normalized, weights, batch,
 
     if weights is not None:
         c_weights = weights.__cuda_array_interface__['data'][0]
-    c_batch = batch.__array_interface__['data'][0]
+    # A batch of None lets the C++ implementation use every vertex as a
+    # source without materializing the list of sources
+    number_of_sources_in_batch = 0
+    if batch is not None:
+        number_of_sources_in_batch = len(batch)
+        c_batch = batch.__array_interface__['data'][0]
     c_handle = <uintptr_t>handle.getHandle()
 
     run_c_edge_betweenness_centrality(c_handle,
@@ -140,21 +144,23 @@ cdef void run_c_edge_betweenness_centrality(uintptr_t c_handle,
                                             uintptr_t c_batch,
                                             result_dtype):
     if result_dtype == np.float64:
-        c_edge_betweenness_centrality[int, int, double, double]((<handle_t *> c_handle)[0],
-                                                                (<GraphCSRView[int, int, double] *> c_graph)[0],
-                                                                <double *> c_betweenness,
-                                                                normalized,
-                                                                <double *> c_weights,
-                                                                number_of_sources_in_batch,
-                                                                <int *> c_batch)
+        with nogil:
+            c_edge_betweenness_centrality[int, int, double, double]((<handle_t *> c_handle)[0],
+                                                                    (<GraphCSRView[int, int, double] *> c_graph)[0],
+                                                                    <double *> c_betweenness,
+                                                                    normalized,
+                                                                    <double *> c_weights,
+                                                                    number_of_sources_in_batch,
+                                                                    <int *> c_batch)
     elif result_dtype == np.float32:
-        c_edge_betweenness_centrality[int, int, float, float]((<handle_t *> c_handle)[0],
-                                                              (<GraphCSRView[int, int, float] *> c_graph)[0],
-                                                              <float *> c_betweenness,
-                                                              normalized,
-                                                              <float *> c_weights,
-                                                              number_of_sources_in_batch,
-                                                              <int *> c_batch)
+        with nogil:
+            c_edge_betweenness_centrality[int, int, float, float]((<handle_t *> c_handle)[0],
+                                                                  (<GraphCSRView[int, int, float] *> c_graph)[0],
+                                                                  <float *> c_betweenness,
+                                                                  normalized,
+                                                                  <float *> c_weights,
+                                                                  number_of_sources_in_batch,
+                                                                  <int *> c_batch)
     else:
         raise ValueError("result_dtype can only be np.float64 or np.float32")
 
@@ -162,6 +168,9 @@ def batch_edge_betweenness_centrality(input_graph,
                                          normalized,
                                          weights, vertices, result_dtype):
     client = get_client()
+    # The sources are split among the workers, they need to be explicit
+    if vertices is None:
+        vertices = np.arange(input_graph.number_of_vertices(), dtype=np.int32)
     comms = Comms.get_comms()
     replicated_adjlists = input_graph.batch_adjlists
     work_futures =  [client.submit(run_mg_work,
@@ -12,11 +12,17 @@
 # limitations under the License.
 
 import gc
+import math
 
 import pytest
 
 import cugraph
 from cugraph.tests import utils
+from cugraph.centrality.betweenness_centrality import (
+    _estimate_vertex_diameter,
+    _initialize_vertices_from_indices_sampling,
+    _number_of_samples_from_epsilon,
+)
 import random
 import numpy as np
 import cudf
@@ -180,12 +186,12 @@ def _calc_bc_subset_fixed(
         "This test is meant for verifying coherence "
         "when k is given as an int"
     )
-    # In the fixed set we compare cu_bc against itself as we random.seed(seed)
-    # on the same seed and then sample on the number of vertices themselves
+    # In the fixed set we compare cu_bc against itself as we sample on the
+    # number of vertices themselves with the same seed
     if seed is None:
-        seed = 123  # random.seed(None) uses time, but we want same sources
-    random.seed(seed)  # It will be called again in cugraph's call
-    sources = random.sample(range(G.number_of_vertices()), k)
+        seed = 123  # seed=None is not reproducible, but we want same sources
+    # It will be called again in cugraph's call
+    sources = _initialize_vertices_from_indices_sampling(G, k, seed).tolist()
 
     if G.renumbered:
         sources_df = cudf.DataFrame({'src': sources})
@@ -505,3 +511,387 @@ def test_betweenness_centrality_nx(
             print(f"{cugraph_bc[i][1]} and {cugraph_bc[i][1]}")
     print("Mismatches:", err)
     assert err < (0.01 * len(cugraph_bc))
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+def test_betweenness_centrality_repeated_sources_list(graph_file, directed):
+    """Calls betweenness_centrality several times on the same graph with
+    different lists of sources, the cached vertex map must not alter the
+    results"""
+    G, Gnx = utils.build_cu_and_nx_graphs(graph_file, directed=directed)
+
+    for seed in SUBSET_SEED_OPTIONS + [1, 2]:
+        random.seed(seed)
+        sources = random.sample(list(Gnx.nodes()), 4)
+        df = cugraph.betweenness_centrality(G, k=sources)
+        sorted_df = df.sort_values("vertex").rename(
+            columns={"betweenness_centrality": "cu_bc"}, copy=False
+        ).reset_index(drop=True)
+
+        nx_bc = nx.betweenness_centrality(Gnx, k=4, seed=seed)
+        _, nx_bc = zip(*sorted(nx_bc.items()))
+        nx_df = cudf.DataFrame({"ref_bc": nx_bc})
+
+        merged_sorted_df = cudf.concat([sorted_df, nx_df], axis=1, sort=False)
+        compare_scores(merged_sorted_df,
+                       first_key="cu_bc", second_key="ref_bc")
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+@pytest.mark.parametrize("sources_type", [cudf.Series, cupy.asarray])
+def test_betweenness_centrality_device_sources(
+    graph_file,
+    directed,
+    sources_type
+):
+    """Sources given as a device array must give the same results as the
+    same sources given as a list"""
+    G, Gnx = utils.build_cu_and_nx_graphs(graph_file, directed=directed)
+
+    random.seed(SUBSET_SEED_OPTIONS[0])
+    sources = random.sample(list(Gnx.nodes()), 4)
+
+    df = cugraph.betweenness_centrality(G, k=sources)
+    sorted_df = df.sort_values("vertex").rename(
+        columns={"betweenness_centrality": "cu_bc"}, copy=False
+    ).reset_index(drop=True)
+
+    df2 = cugraph.betweenness_centrality(
+        G, k=sources_type(np.asarray(sources, dtype=np.int32)))
+    sorted_df2 = df2.sort_values("vertex").rename(
+        columns={"betweenness_centrality": "ref_bc"}, copy=False
+    ).reset_index(drop=True)
+
+    merged_sorted_df = cudf.concat(
+        [sorted_df, sorted_df2["ref_bc"]], axis=1, sort=False
+    )
+    compare_scores(merged_sorted_df, first_key="cu_bc", second_key="ref_bc")
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+def test_betweenness_centrality_auto_dtype(graph_file, directed):
+    """result_dtype='auto' selects np.float32 only for graphs small enough
+    for the scores to remain distinguishable in single precision"""
+    G, Gnx = utils.build_cu_and_nx_graphs(graph_file, directed=directed)
+
+    n = G.number_of_vertices()
+    if n * (n - 1) * (n - 2) // 2 < 2 ** 24:
+        expected_dtype = np.float32
+    else:
+        expected_dtype = np.float64
+
+    df = cugraph.betweenness_centrality(G, result_dtype="auto")
+    assert df["betweenness_centrality"].dtype == expected_dtype
+
+    sorted_df = df.sort_values("vertex").rename(
+        columns={"betweenness_centrality": "cu_bc"}, copy=False
+    ).reset_index(drop=True)
+    nx_bc = nx.betweenness_centrality(Gnx)
+    _, nx_bc = zip(*sorted(nx_bc.items()))
+    nx_df = cudf.DataFrame({"ref_bc": nx_bc})
+
+    merged_sorted_df = cudf.concat([sorted_df, nx_df], axis=1, sort=False)
+    compare_scores(merged_sorted_df, first_key="cu_bc", second_key="ref_bc")
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+@pytest.mark.parametrize("epsilon", [0.3, 0.5])
+def test_betweenness_centrality_epsilon(graph_file, directed, epsilon):
+    """Approximate betweenness centrality with a number of sources derived
+    from epsilon must match the scores of the same sample given as k"""
+    G = utils.generate_cugraph_graph_from_file(graph_file, directed=directed)
+    seed = SUBSET_SEED_OPTIONS[0]
+
+    # The scores must come from a sample of the vertices
+    k = _number_of_samples_from_epsilon(G, epsilon, 0.1, seed)
+    assert k is not None and k < G.number_of_vertices()
+
+    df = cugraph.betweenness_centrality(G, epsilon=epsilon, seed=seed)
+    sorted_df = df.sort_values("vertex").rename(
+        columns={"betweenness_centrality": "cu_bc"}, copy=False
+    ).reset_index(drop=True)
+
+    ref_df = cugraph.betweenness_centrality(G, k=k, seed=seed)
+    sorted_ref_df = ref_df.sort_values("vertex").rename(
+        columns={"betweenness_centrality": "ref_bc"}, copy=False
+    ).reset_index(drop=True)
+
+    merged_sorted_df = cudf.concat(
+        [sorted_df, sorted_ref_df["ref_bc"]], axis=1, sort=False
+    )
+    compare_scores(merged_sorted_df, first_key="cu_bc", second_key="ref_bc")
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_betweenness_centrality_epsilon_adjlist(graph_file):
+    """The vertex diameter estimate must work on a graph built from an
+    adjacency list, which has no edge list until it is requested"""
+    G = utils.generate_cugraph_graph_from_file(graph_file, directed=False)
+    offsets, indices, _ = G.view_adj_list()
+    G_adj = cugraph.Graph()
+    G_adj.from_cudf_adjlist(offsets, indices, None)
+
+    df = cugraph.betweenness_centrality(G_adj, epsilon=0.5,
+                                        seed=SUBSET_SEED_OPTIONS[0])
+    assert len(df) == G_adj.number_of_vertices()
+
+
+def _path_graph(number_of_vertices, directed):
+    src = np.arange(number_of_vertices - 1, dtype=np.int32)
+    df = cudf.DataFrame({"src": src, "dst": src + 1})
+    G = cugraph.Graph(directed=directed)
+    G.from_cudf_edgelist(df, source="src", destination="dst",
+                         renumber=False)
+    return G
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_estimate_vertex_diameter(seed):
+    """The double sweep is exact on an undirected path from any start, on a
+    directed path it is exact once the source of the path is a start even
+    though the second sweeps start from the sink"""
+    number_of_vertices = 10
+    G = _path_graph(number_of_vertices, directed=False)
+    assert _estimate_vertex_diameter(G, seed) == number_of_vertices
+
+    G = _path_graph(number_of_vertices, directed=True)
+    assert _estimate_vertex_diameter(
+        G, seed, number_of_starts=number_of_vertices) == number_of_vertices
+    assert 1 <= _estimate_vertex_diameter(G, seed) <= number_of_vertices
+
+
+def test_number_of_samples_from_epsilon():
+    """The number of samples follows the sample size of Riondato and
+    Kornaropoulos, all the vertices are used once it is not smaller than
+    the number of vertices"""
+    number_of_vertices = 100
+    G = _path_graph(number_of_vertices, directed=False)
+    seed = SUBSET_SEED_OPTIONS[0]
+
+    # floor(log2(100 - 2)) = 6
+    expected_k = math.ceil((0.5 / 0.5 ** 2) * (6 + 1 + math.log(1 / 0.1)))
+    assert _number_of_samples_from_epsilon(G, 0.5, 0.1, seed) == expected_k
+    assert _number_of_samples_from_epsilon(G, 0.05, 0.1, seed) is None
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+def test_betweenness_centrality_async(graph_file, directed):
+    """Queued asynchronous calls must give the same results as the
+    synchronous ones"""
+    G = utils.generate_cugraph_graph_from_file(graph_file, directed=directed)
+    # The synchronous calls use their own graph, G is only used by the
+    # queued calls until they are done
+    G_ref = utils.generate_cugraph_graph_from_file(graph_file,
+                                                   directed=directed)
+
+    seeds = SUBSET_SEED_OPTIONS + [1, 2]
+    futures = [cugraph.betweenness_centrality_async(G, k=4, seed=seed)
+               for seed in seeds]
+
+    for seed, future in zip(seeds, futures):
+        df = cugraph.betweenness_centrality(G_ref, k=4, seed=seed)
+        sorted_df = df.sort_values("vertex").rename(
+            columns={"betweenness_centrality": "cu_bc"}, copy=False
+        ).reset_index(drop=True)
+
+        df2 = future.result()
+        sorted_df2 = df2.sort_values("vertex").rename(
+            columns={"betweenness_centrality": "ref_bc"}, copy=False
+        ).reset_index(drop=True)
+
+        merged_sorted_df = cudf.concat(
+            [sorted_df, sorted_df2["ref_bc"]], axis=1, sort=False
+        )
+        compare_scores(merged_sorted_df,
+                       first_key="cu_bc", second_key="ref_bc")
+
+
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+@pytest.mark.parametrize("normalized", NORMALIZED_OPTIONS)
+@pytest.mark.parametrize("endpoints", ENDPOINTS_OPTIONS)
+def test_betweenness_centrality_many(directed, normalized, endpoints):
+    """Scores computed over several graphs at once must match the scores
+    computed on each graph"""
+    graphs = [
+        utils.generate_cugraph_graph_from_file(graph_file, directed=directed)
+        for graph_file in utils.DATASETS_SMALL
+    ]
+
+    dfs = cugraph.betweenness_centrality_many(
+        graphs, normalized=normalized, endpoints=endpoints)
+    assert len(dfs) == len(graphs)
+
+    for G, df2 in zip(graphs, dfs):
+        df = cugraph.betweenness_centrality(
+            G, normalized=normalized, endpoints=endpoints)
+        sorted_df = df.sort_values("vertex").rename(
+            columns={"betweenness_centrality": "cu_bc"}, copy=False
+        ).reset_index(drop=True)
+        sorted_df2 = df2.sort_values("vertex").rename(
+            columns={"betweenness_centrality": "ref_bc"}, copy=False
+        ).reset_index(drop=True)
+
+        merged_sorted_df = cudf.concat(
+            [sorted_df, sorted_df2["ref_bc"]], axis=1, sort=False
+        )
+        compare_scores(merged_sorted_df,
+                       first_key="cu_bc", second_key="ref_bc")
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+def test_betweenness_centrality_invalid_sources(graph_file, directed):
+    """Test calls betwenness_centrality with a vertex that is not part of
+    the graph"""
+    G, Gnx = utils.build_cu_and_nx_graphs(graph_file, directed=directed)
+    sources = list(Gnx.nodes())[:3] + [max(Gnx.nodes()) + 1]
+
+    with pytest.raises(ValueError):
+        cugraph.betweenness_centrality(G, k=sources)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+@pytest.mark.parametrize("k", [0, []])
+def test_betweenness_centrality_no_sources(graph_file, directed, k):
+    """Test calls betwenness_centrality without any source, every score
+    must be 0"""
+    G, Gnx = utils.build_cu_and_nx_graphs(graph_file, directed=directed)
+
+    df = cugraph.betweenness_centrality(G, k=k)
+
+    assert len(df) == Gnx.number_of_nodes()
+    assert set(df["vertex"].values_host) == set(Gnx.nodes())
+    assert (df["betweenness_centrality"] == 0).all()
+
+
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+@pytest.mark.parametrize("endpoints", ENDPOINTS_OPTIONS)
+def test_betweenness_centrality_two_vertices(directed, endpoints):
+    """Test calls betwenness_centrality on a graph with fewer than 3
+    vertices"""
+    Gnx = nx.DiGraph() if directed else nx.Graph()
+    Gnx.add_edge(0, 1)
+
+    cu_bc = cugraph.betweenness_centrality(Gnx, endpoints=endpoints)
+    nx_bc = nx.betweenness_centrality(Gnx, endpoints=endpoints)
+
+    for vertex, score in nx_bc.items():
+        assert cu_bc[vertex] == pytest.approx(score)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+@pytest.mark.parametrize("sources_type", [tuple, np.asarray])
+def test_betweenness_centrality_sequence_sources(
+    graph_file, directed, sources_type
+):
+    """Test calls betwenness_centrality with sources given as a sequence
+    other than a list, the results must match the ones of the list"""
+    G, Gnx = utils.build_cu_and_nx_graphs(graph_file, directed=directed)
+    random.seed(SUBSET_SEED_OPTIONS[0])
+    sources = random.sample(list(Gnx.nodes()), 4)
+
+    ref_df = cugraph.betweenness_centrality(G, k=sources)
+    df = cugraph.betweenness_centrality(G, k=sources_type(sources))
+
+    merged_df = ref_df.merge(df, on="vertex", suffixes=["_ref", "_cu"])
+    compare_scores(merged_df, first_key="betweenness_centrality_cu",
+                   second_key="betweenness_centrality_ref")
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+def test_betweenness_centrality_out(graph_file, directed):
+    """Test calls betwenness_centrality several times reusing the output
+    of the first call, the scores must match the ones of a new output"""
+    cu_M = utils.read_csv_file(graph_file)
+    G = cugraph.Graph(directed=directed)
+    G.from_cudf_edgelist(cu_M, source="0", destination="1", renumber=False)
+
+    out = cugraph.betweenness_centrality(G, k=4, seed=1)
+    for seed in SUBSET_SEED_OPTIONS:
+        ref_df = cugraph.betweenness_centrality(G, k=4, seed=seed)
+        df = cugraph.betweenness_centrality(G, k=4, seed=seed, out=out)
+        assert df is out
+
+        merged_df = ref_df.merge(df, on="vertex", suffixes=["_ref", "_cu"])
+        compare_scores(merged_df, first_key="betweenness_centrality_cu",
+                       second_key="betweenness_centrality_ref")
+
+    with pytest.raises(ValueError):
+        cugraph.betweenness_centrality(G, result_dtype=np.float32, out=out)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_betweenness_centrality_k_too_large(graph_file):
+    """Test calls betwenness_centrality with more samples than vertices"""
+    G = utils.generate_cugraph_graph_from_file(graph_file)
+
+    with pytest.raises(ValueError):
+        cugraph.betweenness_centrality(G, k=G.number_of_vertices() + 1)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_betweenness_centrality_sources_cast(graph_file):
+    """Test calls betwenness_centrality with vertices that only match a
+    vertex of the graph once cast to the type of its identifiers"""
+    G, Gnx = utils.build_cu_and_nx_graphs(graph_file)
+    vertex = list(Gnx.nodes())[0]
+
+    for sources in [cudf.Series([vertex + 2 ** 32], dtype=np.int64),
+                    cudf.Series([vertex + 0.5], dtype=np.float64)]:
+        with pytest.raises(ValueError):
+            cugraph.betweenness_centrality(G, k=sources)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_betweenness_centrality_sources_cast_unrenumbered(directed):
+    """Test calls betwenness_centrality on a graph that is not renumbered
+    with vertices that are fractional, out of the range of the vertex type or
+    missing"""
+    G = _path_graph(10, directed)
+
+    for sources in [[1.5],
+                    cudf.Series([1 + 2 ** 32], dtype=np.int64),
+                    cudf.Series([0, None])]:
+        with pytest.raises(ValueError):
+            cugraph.betweenness_centrality(G, k=sources)
+
+
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+def test_betweenness_centrality_strided_sources(directed):
+    """Test calls betwenness_centrality with sources given as a strided
+    numpy array, the results must match the ones of the list"""
+    G = _path_graph(10, directed)
+    sources = np.arange(10, dtype=np.int32)[::2]
+
+    ref_df = cugraph.betweenness_centrality(G, k=sources.tolist())
+    df = cugraph.betweenness_centrality(G, k=sources)
+
+    merged_df = ref_df.merge(df, on="vertex", suffixes=["_ref", "_cu"])
+    compare_scores(merged_df, first_key="betweenness_centrality_cu",
+                   second_key="betweenness_centrality_ref")
+
+
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+def test_betweenness_centrality_async_sources_mutated(directed):
+    """Queued asynchronous calls must use the sources given at call time
+    even if the caller changes them right after the call"""
+    G = _path_graph(10, directed)
+    G_ref = _path_graph(10, directed)
+    sources = np.array([0, 2, 4], dtype=np.int32)
+
+    ref_df = cugraph.betweenness_centrality(G_ref, k=sources.tolist())
+    future = cugraph.betweenness_centrality_async(G, k=sources)
+    sources[:] = [9, 8, 7]
+    df = future.result()
+
+    merged_df = ref_df.merge(df, on="vertex", suffixes=["_ref", "_cu"])
+    compare_scores(merged_df, first_key="betweenness_centrality_cu",
+                   second_key="betweenness_centrality_ref")
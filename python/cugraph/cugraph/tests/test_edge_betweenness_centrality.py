@@ -17,6 +17,9 @@ import pytest
 
 import cugraph
 from cugraph.tests import utils
+from cugraph.centrality.betweenness_centrality import (
+    _initialize_vertices_from_indices_sampling,
+)
 import random
 import numpy as np
 import cupy
@@ -188,12 +191,12 @@ def _calc_bc_subset_fixed(G, Gnx, normalized, weight, k, seed, result_dtype):
         "This test is meant for verifying coherence "
         "when k is given as an int"
     )
-    # In the fixed set we compare cu_bc against itself as we random.seed(seed)
-    # on the same seed and then sample on the number of vertices themselves
+    # In the fixed set we compare cu_bc against itself as we sample on the
+    # number of vertices themselves with the same seed
     if seed is None:
-        seed = 123  # random.seed(None) uses time, but we want same sources
-    random.seed(seed)  # It will be called again in cugraph's call
-    sources = random.sample(range(G.number_of_vertices()), k)
+        seed = 123  # seed=None is not reproducible, but we want same sources
+    # It will be called again in cugraph's call
+    sources = _initialize_vertices_from_indices_sampling(G, k, seed).tolist()
 
     if G.renumbered:
         sources_df = cudf.DataFrame({'src': sources})
@@ -512,3 +515,17 @@ def test_edge_betweenness_centrality_nx(
             print(f"{cugraph_bc[i][1]} and {cugraph_bc[i][1]}")
     print("Mismatches:", err)
     assert err < (0.01 * len(cugraph_bc))
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+@pytest.mark.parametrize("k", [0, []])
+def test_edge_betweenness_centrality_no_sources(graph_file, directed, k):
+    """Test calls edge_betwenness_centrality without any source, every
+    score must be 0"""
+    G, Gnx = utils.build_cu_and_nx_graphs(graph_file, directed=directed)
+
+    df = cugraph.edge_betweenness_centrality(G, k=k)
+
+    assert len(df) == Gnx.number_of_edges()
+    assert (df["betweenness_centrality"] == 0).all()